@@ -1,30 +1,49 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import argparse
 import asyncio
+import contextlib
 import logging
-import json
 import os
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+import platform
+import random
+import socket
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator, Awaitable, Callable
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field
+from functools import cached_property
+import aiodns
+import aiohttp
+import diskcache
+import orjson
 import yaml
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
 # Core data structures
-@dataclass
+@dataclass(slots=True)
 class ScanTarget:
     domain: str
     ip_addresses: List[str] = None
     subdomains: List[str] = None
-    timestamp: str = datetime.now().isoformat()
+    timestamp: str = field(default_factory=_now_iso)
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     target: ScanTarget
     module_name: str
     data: Dict[str, Any]
-    timestamp: str = datetime.now().isoformat()
+    timestamp: str = field(default_factory=_now_iso)
     status: str = "success"
     error: Optional[str] = None
 
@@ -38,7 +57,7 @@ class ConfigManager:
             return self._create_default_config()
         
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
 
     def _create_default_config(self) -> dict:
         config = {
@@ -69,145 +88,278 @@ class ConfigManager:
         
         return config
 
+    # Frequently read sections, resolved once instead of on every lookup
+    @cached_property
+    def api_keys(self) -> Dict[str, str]:
+        return self.config['api_keys']
+
+    @cached_property
+    def modules_enabled(self) -> Dict[str, bool]:
+        return self.config['modules']
+
+    @cached_property
+    def scan_options(self) -> Dict[str, Any]:
+        return self.config['scan_options']
+
+    @cached_property
+    def output_dir(self) -> str:
+        return self.config['output']['directory']
+
+    @cached_property
+    def cache_dir(self) -> str:
+        """Directory holding the on-disk lookup cache shared across scans."""
+        return self.scan_options.get('cache_dir', '.osint_cache')
+
+    @cached_property
+    def ports_range(self) -> str:
+        """Port specification for scanning, e.g. '21-443' or '22,80,443'."""
+        ports = self.scan_options.get('ports', {})
+        if isinstance(ports, list):
+            return ','.join(str(port) for port in ports)
+        return ports.get('range', '21-443')
+
     def get_api_key(self, service: str) -> str:
-        return self.config['api_keys'].get(service, '')
+        return self.api_keys.get(service, '')
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create an HTTP session whose connection pool and DNS cache are shared by all modules."""
+    # aiodns (c-ares) needs a selector event loop, which Windows does not use by default
+    if platform.system() == 'Windows':
+        resolver = aiohttp.ThreadedResolver()
+    else:
+        resolver = aiohttp.AsyncResolver()
+
+    connector = aiohttp.TCPConnector(
+        resolver=resolver,
+        limit=100,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        enable_cleanup_closed=True
+    )
+    # No overall deadline: large bodies such as crt.sh or HIBP responses may take longer
+    # than a few seconds to stream, so only stalled connects and reads are cut off
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+    )
+
+def create_dns_resolver() -> aiodns.DNSResolver:
+    """Create a c-ares resolver that gives up quickly, so lookups against a dead server fail fast."""
+    return aiodns.DNSResolver(timeout=2.0, tries=2)
+
+async def resolve_ipv4(resolver: aiodns.DNSResolver, domain: str) -> List[str]:
+    """Return the IPv4 addresses of `domain` in resolver order, without duplicates."""
+    result = await resolver.getaddrinfo(domain, socket.AF_INET)
+    addresses = (node.addr[0] for node in result.nodes)
+    # pycares returns the address as bytes from 5.0 on, as str before
+    return list(dict.fromkeys(
+        address.decode() if isinstance(address, bytes) else address for address in addresses
+    ))
 
 class BaseModule(ABC):
+    MAX_REQUESTS_PER_HOST = 10
+    # Most time (seconds) one request may spend waiting out rate limits before giving up
+    MAX_RETRY_DELAY = 60
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-
-    @abstractmethod
-    async def run(self, target: ScanTarget) -> ScanResult:
-        pass
+        self._http: Optional[aiohttp.ClientSession] = None
+        # Only a session or resolver this module created itself is closed by aclose()
+        self._owns_http = False
+        self._resolver: Optional[aiodns.DNSResolver] = None
+        self._owns_resolver = False
+        # Caps concurrent requests to any single host (crt.sh, twitter, ...)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.MAX_REQUESTS_PER_HOST)
+        )
+        # Requests currently on the wire, so identical concurrent ones share a result
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._cache: Optional[diskcache.Cache] = None
 
     @property
-    @abstractmethod
-    def module_name(self) -> str:
-        pass
+    def http(self) -> aiohttp.ClientSession:
+        # Created lazily so the session is bound to the running event loop
+        if self._http is None or self._http.closed:
+            self._http = create_http_session()
+            self._owns_http = True
+        return self._http
+
+    @http.setter
+    def http(self, session: aiohttp.ClientSession):
+        self._http = session
+        self._owns_http = False
 
-class PassiveReconModule(BaseModule):
     @property
-    def module_name(self) -> str:
-        return "passive_recon"
+    def resolver(self) -> aiodns.DNSResolver:
+        # Async c-ares resolver; avoids a thread hop per lookup
+        if self._resolver is None:
+            self._resolver = create_dns_resolver()
+            self._owns_resolver = True
+        return self._resolver
+
+    @resolver.setter
+    def resolver(self, resolver: aiodns.DNSResolver):
+        self._resolver = resolver
+        self._owns_resolver = False
 
-    async def run(self, target: ScanTarget) -> ScanResult:
+    @property
+    def cache(self) -> diskcache.Cache:
+        """On-disk cache of lookup results, shared across scans."""
+        if self._cache is None:
+            self._cache = diskcache.Cache(self.config.cache_dir)
+        return self._cache
+
+    def _cache_get(self, key: tuple) -> Any:
+        """Look up a cached result; an unusable cache is treated as a miss."""
         try:
-            # Implement passive reconnaissance logic
-            data = {
-                'whois': await self._get_whois(target.domain),
-                'dns_records': await self._get_dns_records(target.domain),
-                'certificate_info': await self._get_certificate_info(target.domain)
-            }
-            return ScanResult(target=target, module_name=self.module_name, data=data)
+            return self.cache.get(key)
         except Exception as e:
-            return ScanResult(
-                target=target,
-                module_name=self.module_name,
-                data={},
-                status="error",
-                error=str(e)
-            )
-
-    async def _get_whois(self, domain: str) -> dict:
-        # Implement WHOIS lookup
-        pass
-
-    async def _get_dns_records(self, domain: str) -> dict:
-        # Implement DNS record gathering
-        pass
-
-    async def _get_certificate_info(self, domain: str) -> dict:
-        # Implement certificate analysis
-        pass
-
-class ActiveReconModule(BaseModule):
-    @property
-    def module_name(self) -> str:
-        return "active_recon"
+            self.logger.debug(f"Could not read cached {key[0]} result: {str(e)}")
+            return None
 
-    async def run(self, target: ScanTarget) -> ScanResult:
+    def _cache_set(self, key: tuple, value: Any, ttl: int):
+        """Store a lookup result; a failed write only costs a re-fetch next scan."""
         try:
-            data = {
-                'open_ports': await self._scan_ports(target),
-                'vulnerabilities': await self._scan_vulnerabilities(target),
-                'technologies': await self._detect_technologies(target)
-            }
-            return ScanResult(target=target, module_name=self.module_name, data=data)
+            self.cache.set(key, value, expire=ttl)
         except Exception as e:
-            return ScanResult(
-                target=target,
-                module_name=self.module_name,
-                data={},
-                status="error",
-                error=str(e)
-            )
-
-class SocialMediaModule(BaseModule):
-    @property
-    def module_name(self) -> str:
-        return "social_media"
+            self.logger.debug(f"Could not cache {key[0]} result: {str(e)}")
+
+    async def _get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        **kwargs: Any
+    ) -> Tuple[int, str]:
+        """Rate-limit-aware GET, holding a per-host concurrency slot for the whole exchange."""
+        key = (url, tuple(sorted((kwargs.get('headers') or {}).items())))
+        return await self._single_flight(key, lambda: self._get_limited(session, url, **kwargs))
+
+    async def _get_limited(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        **kwargs: Any
+    ) -> Tuple[int, str]:
+        async with self._host_semaphores[urlsplit(url).hostname]:
+            return await self._get_with_retry(session, url, **kwargs)
+
+    async def _single_flight(self, key: Any, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `coro_factory()` once per `key` at a time; concurrent callers await the same result."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = future
+            # Forget the request once it settles, not when the caller that started it returns
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so cancelling any one caller, the first included, leaves the others' request running
+        return await asyncio.shield(future)
+
+    async def _get_with_retry(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        attempts: int = 5
+    ) -> Tuple[int, str]:
+        """GET `url` and return (status, body), backing off with jitter while rate limited (429)."""
+        async with self._stream_with_retry(session, url, headers=headers, attempts=attempts) as response:
+            return response.status, await response.text()
+
+    @contextlib.asynccontextmanager
+    async def _stream_with_retry(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        attempts: int = 5
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """GET `url` and yield the unread response, backing off with jitter while rate limited (429)."""
+        waited = 0.0
+        for attempt in range(attempts):
+            response = await session.get(url, headers=headers)
+            delay = None
+            if response.status == 429 and attempt < attempts - 1:
+                # Honour a numeric Retry-After, otherwise back off exponentially
+                try:
+                    delay = max(0.0, float(response.headers.get('Retry-After')))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                if waited + delay > self.MAX_RETRY_DELAY:
+                    # Waiting that long would stall the scan; hand the 429 back instead
+                    self.logger.debug(f"Rate limited by {url} for {delay:.0f}s more, giving up")
+                    delay = None
+
+            if delay is None:
+                try:
+                    yield response
+                finally:
+                    # Hand the connection back to the pool as soon as the caller is done
+                    response.release()
+                return
+
+            response.release()
+            self.logger.debug(f"Rate limited by {url}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay + random.random())
+            waited += delay
+
+    async def aclose(self):
+        if self._cache is not None:
+            self._cache.close()
+        if self._owns_http and not self._http.closed:
+            await self._http.close()
+        if self._owns_resolver:
+            await self._resolver.close()
+            self._resolver = None
+            self._owns_resolver = False
 
+    @abstractmethod
     async def run(self, target: ScanTarget) -> ScanResult:
-        try:
-            data = {
-                'profiles': await self._find_profiles(target),
-                'mentions': await self._gather_mentions(target),
-                'related_accounts': await self._find_related_accounts(target)
-            }
-            return ScanResult(target=target, module_name=self.module_name, data=data)
-        except Exception as e:
-            return ScanResult(
-                target=target,
-                module_name=self.module_name,
-                data={},
-                status="error",
-                error=str(e)
-            )
+        pass
 
-class DarkWebModule(BaseModule):
     @property
+    @abstractmethod
     def module_name(self) -> str:
-        return "dark_web"
+        pass
 
-    async def run(self, target: ScanTarget) -> ScanResult:
-        try:
-            data = {
-                'leaks': await self._search_leaks(target),
-                'mentions': await self._search_mentions(target),
-                'related_data': await self._gather_related_data(target)
-            }
-            return ScanResult(target=target, module_name=self.module_name, data=data)
-        except Exception as e:
-            return ScanResult(
-                target=target,
-                module_name=self.module_name,
-                data={},
-                status="error",
-                error=str(e)
-            )
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively, such as sets."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
 
 class ResultsManager:
     def __init__(self, config: ConfigManager):
         self.config = config
-        self.results_dir = config.config['output']['directory']
+        self.results_dir = config.output_dir
         os.makedirs(self.results_dir, exist_ok=True)
 
     def save_results(self, results: List[ScanResult], target: ScanTarget):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # UTC, like the target and result timestamps
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{self.results_dir}/osint_{target.domain}_{timestamp}.json"
         
         output = {
-            'target': asdict(target),
-            'scan_results': [asdict(result) for result in results],
+            # orjson serializes dataclasses natively, so no asdict() deep copy is needed
+            'target': target,
+            'scan_results': results,
             'metadata': {
-                'timestamp': timestamp,
+                'timestamp': now.isoformat(),
                 'framework_version': '1.0.0'
             }
         }
 
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=4)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(
+                output,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
         
         return filename
 
@@ -215,25 +367,89 @@ class OSINTFramework:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = ConfigManager(config_path)
         self.results_manager = ResultsManager(self.config)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._resolver: Optional[aiodns.DNSResolver] = None
         
+        # Imported here because the modules themselves import BaseModule from this file
+        from .modules.passive import PassiveReconModule
+        from .modules.active import ActiveReconModule
+        from .modules.social import SocialMediaModule
+        from .modules.dark import DarkWebModule
+
         # Initialize modules
         self.modules = []
-        if self.config.config['modules']['passive_recon']:
+        enabled = self.config.modules_enabled
+        if enabled['passive_recon']:
             self.modules.append(PassiveReconModule(self.config))
-        if self.config.config['modules']['active_recon']:
+        if enabled['active_recon']:
             self.modules.append(ActiveReconModule(self.config))
-        if self.config.config['modules']['social_media']:
+        if enabled['social_media']:
             self.modules.append(SocialMediaModule(self.config))
-        if self.config.config['modules']['dark_web']:
+        if enabled['dark_web']:
             self.modules.append(DarkWebModule(self.config))
 
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        # Kept across scans so keep-alive connections and TLS sessions are reused
+        if self._http is None or self._http.closed:
+            self._http = create_http_session()
+        return self._http
+
+    @property
+    def resolver(self) -> aiodns.DNSResolver:
+        # Like the session, created on first use so it binds to the running loop
+        if self._resolver is None:
+            self._resolver = create_dns_resolver()
+        return self._resolver
+
+    async def aclose(self):
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+        # The helpers keep their own session and resolver for the running loop
+        from .utils.helpers import NetworkUtils
+        await NetworkUtils.close_session()
+
     async def scan(self, domain: str) -> str:
         target = ScanTarget(domain=domain)
-        results = []
 
-        for module in self.modules:
-            result = await module.run(target)
-            results.append(result)
+        resolver = self.resolver
+
+        # Resolve once up front so concurrently running modules don't race on target.ip_addresses
+        try:
+            target.ip_addresses = await resolve_ipv4(resolver, domain)
+        except aiodns.error.DNSError as e:
+            self.logger.warning(f"Could not resolve {domain}: {str(e)}")
+
+        async with contextlib.AsyncExitStack() as stack:
+            # One session (and connection pool) and resolver for every module
+            http = self.http
+            for module in self.modules:
+                module.http = http
+                module.resolver = resolver
+                stack.push_async_callback(module.aclose)
+
+            # Modules are independent, so run them concurrently
+            outcomes = await asyncio.gather(
+                *(module.run(target) for module in self.modules),
+                return_exceptions=True
+            )
+
+        results = []
+        for module, outcome in zip(self.modules, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = ScanResult(
+                    target=target,
+                    module_name=module.module_name,
+                    data={},
+                    status="error",
+                    error=str(outcome)
+                )
+            results.append(outcome)
 
         return self.results_manager.save_results(results, target)
 
@@ -251,7 +467,14 @@ def main():
 
     # Run the framework
     framework = OSINTFramework(args.config)
-    result_file = asyncio.run(framework.scan(args.domain))
+
+    async def run_scan() -> str:
+        try:
+            return await framework.scan(args.domain)
+        finally:
+            await framework.aclose()
+
+    result_file = asyncio.run(run_scan())
     print(f"\n[+] Scan completed. Results saved to: {result_file}")
 
 if __name__ == "__main__":
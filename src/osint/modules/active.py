@@ -1,11 +1,13 @@
 import asyncio
 import aiohttp
-import socket
+import contextlib
+import ssl
 import nmap
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional
 from bs4 import BeautifulSoup
-from ..framework import BaseModule, ScanTarget, ScanResult
-from ..utils.helpers import get_web_technologies
+from multidict import CIMultiDict
+from ..framework import BaseModule, ScanTarget, ScanResult, resolve_ipv4
+from ..utils.helpers import WebUtils
 
 class ActiveReconModule(BaseModule):
     """
@@ -17,6 +19,10 @@ class ActiveReconModule(BaseModule):
     - Basic vulnerability assessment
     """
 
+    # TCP connect probe settings for the port scan
+    PORT_PROBE_TIMEOUT = 0.5
+    PORT_PROBE_CONCURRENCY = 500
+
     @property
     def module_name(self) -> str:
         return "active_recon"
@@ -28,18 +34,18 @@ class ActiveReconModule(BaseModule):
             
             # Get target IP if not already available
             if not target.ip_addresses:
-                ip = await asyncio.to_thread(socket.gethostbyname, target.domain)
-                target.ip_addresses = [ip]
+                target.ip_addresses = await resolve_ipv4(self.resolver, target.domain)
 
             # Run active recon tasks
             ports_task = asyncio.create_task(self._scan_ports(target))
-            web_task = asyncio.create_task(self._analyze_web_presence(target))
-            vuln_task = asyncio.create_task(self._check_vulnerabilities(target))
+            web_info = await self._analyze_web_presence(target)
+
+            # Reuse the HTTPS response headers rather than fetching the page again
+            https_headers = web_info.get('https', {}).get('headers')
+            vuln_info = await self._check_vulnerabilities(target, https_headers)
 
             # Gather results
             ports_info = await ports_task
-            web_info = await web_task
-            vuln_info = await vuln_task
 
             data = {
                 'port_scan': ports_info,
@@ -60,39 +66,69 @@ class ActiveReconModule(BaseModule):
             )
 
     async def _scan_ports(self, target: ScanTarget) -> Dict[str, Any]:
-        """Perform port scanning and service detection."""
+        """
+        Perform port scanning and service detection.
+
+        Open ports are found with concurrent asyncio TCP connect probes; nmap
+        service detection is then run only against the ports found open.
+        """
         try:
-            # Initialize scanner
-            scanner = nmap.PortScanner()
-            
-            # Get scan options from config
-            scan_options = self.config.config['scan_options'].get('ports', {})
-            port_range = scan_options.get('range', '21-443')
-            
-            # Perform scan using asyncio.to_thread for CPU-bound operation
-            scan_arguments = f'-sS -sV -p{port_range} -T4'
-            results = await asyncio.to_thread(
-                scanner.scan,
-                target.ip_addresses[0],
-                arguments=scan_arguments
-            )
+            host = target.ip_addresses[0]
+            ports = self._parse_port_range(self.config.ports_range)
+            pending_ports = iter(ports)
+            open_ports = []
+
+            async def probe_worker():
+                # Workers share one iterator, so at most PORT_PROBE_CONCURRENCY tasks ever exist
+                for port in pending_ports:
+                    try:
+                        _, writer = await asyncio.wait_for(
+                            asyncio.open_connection(host, port),
+                            self.PORT_PROBE_TIMEOUT
+                        )
+                    except (OSError, asyncio.TimeoutError):
+                        continue
+                    writer.close()
+                    with contextlib.suppress(OSError):
+                        await writer.wait_closed()
+                    open_ports.append(port)
+
+            workers = min(self.PORT_PROBE_CONCURRENCY, len(ports))
+            await asyncio.gather(*(probe_worker() for _ in range(workers)))
+            open_ports.sort()
 
-            # Process results
-            scan_data = {}
-            if target.ip_addresses[0] in scanner.all_hosts():
-                host_data = scanner[target.ip_addresses[0]]
-                scan_data = {
-                    'status': host_data.state(),
-                    'ports': {
-                        port: {
+            scan_data = {
+                'status': 'up' if open_ports else 'unknown',
+                'ports': {
+                    port: {'state': 'open', 'service': '', 'product': '', 'version': ''}
+                    for port in open_ports
+                }
+            }
+            if not open_ports:
+                return scan_data
+
+            # Fingerprint services on the (small) open subset only
+            try:
+                scanner = nmap.PortScanner()
+                port_list = ','.join(str(port) for port in open_ports)
+                await asyncio.to_thread(
+                    scanner.scan,
+                    host,
+                    arguments=f'-sV -p{port_list} -T4'
+                )
+
+                if host in scanner.all_hosts():
+                    host_data = scanner[host]
+                    scan_data['status'] = host_data.state()
+                    for port, data in host_data.get('tcp', {}).items():
+                        scan_data['ports'][port] = {
                             'state': data['state'],
                             'service': data['name'],
                             'product': data.get('product', ''),
                             'version': data.get('version', '')
                         }
-                        for port, data in host_data['tcp'].items()
-                    }
-                }
+            except Exception as e:
+                self.logger.error(f"Service detection failed: {str(e)}")
 
             return scan_data
 
@@ -100,60 +136,108 @@ class ActiveReconModule(BaseModule):
             self.logger.error(f"Port scanning failed: {str(e)}")
             return {'error': str(e)}
 
+    @staticmethod
+    def _parse_port_range(port_range: str) -> List[int]:
+        """
+        Expand a port specification such as '21-443' or '22,80,8000-8080'.
+
+        Raises ValueError for anything that is not a port number or an ascending range of them.
+        """
+        ports = set()
+        for part in str(port_range).split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                start, end = map(int, part.split('-', 1))
+            else:
+                start = end = int(part)
+            if not 1 <= start <= end <= 65535:
+                raise ValueError(f"Invalid port specification: {part!r}")
+            ports.update(range(start, end + 1))
+        return sorted(ports)
+
     async def _analyze_web_presence(self, target: ScanTarget) -> Dict[str, Any]:
-        """Analyze web technologies and server information."""
+        """
+        Analyze web technologies and server information.
+
+        HTTPS is probed first; plain HTTP is only requested when HTTPS cannot
+        be reached at all (connection, timeout or TLS failure).
+        """
         results = {}
-        
-        async with aiohttp.ClientSession() as session:
-            for protocol in ['http', 'https']:
-                url = f"{protocol}://{target.domain}"
-                try:
-                    async with session.get(url, timeout=10) as response:
-                        # Get headers
-                        headers = dict(response.headers)
-                        
-                        # Get page content
+        session = self.http
+
+        for protocol in ['https', 'http']:
+            url = f"{protocol}://{target.domain}"
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    # Get headers
+                    headers = dict(response.headers)
+                    
+                    # Only download and parse the body when it is actually HTML;
+                    # lxml's C parser is much faster than the pure-Python html.parser
+                    if 'html' in response.content_type:
                         content = await response.text()
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # Use helper to detect technologies
-                        technologies = await get_web_technologies(soup, headers)
-                        
-                        results[protocol] = {
-                            'status_code': response.status,
-                            'server': headers.get('Server', ''),
-                            'technologies': technologies,
-                            'headers': headers
-                        }
-                except Exception as e:
-                    self.logger.error(f"Web analysis failed for {url}: {str(e)}")
-                    results[protocol] = {'error': str(e)}
+                    else:
+                        content = ''
+                    soup = BeautifulSoup(content, 'lxml')
+                    
+                    # Use helper to detect technologies
+                    technologies = await WebUtils.get_web_technologies(soup, headers)
+                    
+                    results[protocol] = {
+                        'status_code': response.status,
+                        'server': headers.get('Server', ''),
+                        'technologies': technologies,
+                        'headers': headers
+                    }
+                break
+            except (aiohttp.ClientConnectionError, ssl.SSLError, asyncio.TimeoutError) as e:
+                # Unreachable over this scheme (refused, dropped, timed out, TLS); try the next one
+                self.logger.error(f"Web analysis failed for {url}: {str(e)}")
+                results[protocol] = {'error': str(e)}
+            except Exception as e:
+                self.logger.error(f"Web analysis failed for {url}: {str(e)}")
+                results[protocol] = {'error': str(e)}
+                break
         
         return results
 
-    async def _check_vulnerabilities(self, target: ScanTarget) -> Dict[str, Any]:
-        """Perform basic vulnerability checks."""
+    async def _check_vulnerabilities(
+        self,
+        target: ScanTarget,
+        headers: Optional[Mapping[str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Perform basic vulnerability checks.
+
+        Args:
+            target: Scan target
+            headers: HTTPS response headers fetched by _analyze_web_presence,
+                or None if the site could not be reached over HTTPS
+        """
         vulnerabilities = {}
+
+        if headers is None:
+            self.logger.debug(f"Security header check skipped: HTTPS unavailable for {target.domain}")
+            return vulnerabilities
         
         # Check for common security headers
-        async with aiohttp.ClientSession() as session:
-            try:
-                url = f"https://{target.domain}"
-                async with session.get(url) as response:
-                    headers = response.headers
-                    security_headers = {
-                        'Strict-Transport-Security': headers.get('Strict-Transport-Security'),
-                        'Content-Security-Policy': headers.get('Content-Security-Policy'),
-                        'X-Frame-Options': headers.get('X-Frame-Options'),
-                        'X-XSS-Protection': headers.get('X-XSS-Protection'),
-                        'X-Content-Type-Options': headers.get('X-Content-Type-Options')
-                    }
-                    
-                    vulnerabilities['missing_security_headers'] = [
-                        header for header, value in security_headers.items()
-                        if not value
-                    ]
-            except Exception as e:
-                self.logger.error(f"Security header check failed: {str(e)}")
+        try:
+            headers = CIMultiDict(headers)
+            security_headers = {
+                'Strict-Transport-Security': headers.get('Strict-Transport-Security'),
+                'Content-Security-Policy': headers.get('Content-Security-Policy'),
+                'X-Frame-Options': headers.get('X-Frame-Options'),
+                'X-XSS-Protection': headers.get('X-XSS-Protection'),
+                'X-Content-Type-Options': headers.get('X-Content-Type-Options')
+            }
+            
+            vulnerabilities['missing_security_headers'] = [
+                header for header, value in security_headers.items()
+                if not value
+            ]
+        except Exception as e:
+            self.logger.error(f"Security header check failed: {str(e)}")
         
         return vulnerabilities
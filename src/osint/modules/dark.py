@@ -1,9 +1,13 @@
 import asyncio
 import aiohttp
-import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+import contextlib
+import heapq
+import ijson
+import orjson
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Any, AsyncIterator, Awaitable, List
+from urllib.parse import quote_plus
 from ..framework import BaseModule, ScanTarget, ScanResult
 
 class DarkWebModule(BaseModule):
@@ -19,6 +23,21 @@ class DarkWebModule(BaseModule):
     to ensure ethical operation.
     """
 
+    # The HIBP breach catalogue changes rarely, so it is fetched at most once an hour;
+    # the index lives in the on-disk cache (config.cache_dir) and so outlasts a single run
+    HIBP_CACHE_TTL = 3600
+    HIBP_BREACHES_URL = "https://haveibeenpwned.com/api/v3/breaches"
+
+    # (forum, search URL template) pairs, built once at import time
+    SECURITY_FORUMS = tuple(
+        (forum, f"{forum}/search.json?q={{q}}")
+        for forum in (
+            'https://www.reddit.com/r/netsec',
+            'https://www.reddit.com/r/InfoSecNews',
+            'https://community.riskiq.com'
+        )
+    )
+
     @property
     def module_name(self) -> str:
         return "dark_web"
@@ -68,27 +87,24 @@ class DarkWebModule(BaseModule):
         breaches = {
             'known_breaches': [],
             'potential_exposures': [],
-            'last_checked': datetime.now().isoformat()
+            'last_checked': target.timestamp
         }
 
         try:
             # Check HaveIBeenPwned API
             hibp_key = self.config.get_api_key('haveibeenpwned')
             if hibp_key:
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'hibp-api-key': hibp_key,
-                        'user-agent': 'OSINT-Framework-Research'
-                    }
-                    url = f"https://haveibeenpwned.com/api/v3/breaches"
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            all_breaches = await response.json()
-                            domain_breaches = [
-                                breach for breach in all_breaches
-                                if target.domain in breach.get('Domain', '')
-                            ]
-                            breaches['known_breaches'].extend(domain_breaches)
+                session = self.http
+                headers = {
+                    'hibp-api-key': hibp_key,
+                    'user-agent': 'OSINT-Framework-Research'
+                }
+                breach_index = await self._get_hibp_breaches(
+                    session, self.HIBP_BREACHES_URL, headers
+                )
+                breaches['known_breaches'].extend(
+                    breach_index.get(target.domain.lower(), [])
+                )
 
             # Check other legitimate breach databases
             additional_sources = [
@@ -97,12 +113,13 @@ class DarkWebModule(BaseModule):
                 self._check_recorded_future(target)
             ]
             
-            additional_results = await asyncio.gather(*additional_sources)
-            for result in additional_results:
-                if result.get('breaches'):
-                    breaches['known_breaches'].extend(result['breaches'])
-                if result.get('potential'):
-                    breaches['potential_exposures'].extend(result['potential'])
+            # Merge each source's findings as soon as it answers
+            async with contextlib.aclosing(self._bounded_as_completed(additional_sources)) as results:
+                async for result in results:
+                    if result.get('breaches'):
+                        breaches['known_breaches'].extend(result['breaches'])
+                    if result.get('potential'):
+                        breaches['potential_exposures'].extend(result['potential'])
 
         except Exception as e:
             self.logger.error(f"Error checking breaches: {str(e)}")
@@ -110,6 +127,59 @@ class DarkWebModule(BaseModule):
 
         return breaches
 
+    async def _get_hibp_breaches(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return the HIBP breach list indexed by lowercase domain, refreshing it when stale.
+
+        Each breach is filed under its own domain and every parent domain
+        (``mail.example.com`` is also listed under ``example.com``), so a single
+        lookup finds all breaches at or below a target domain.
+        """
+        key = ('hibp', url)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return index
+            # Stream the (large) array instead of materialising the whole body first
+            async for breach in ijson.items_async(response.content, 'item', use_float=True):
+                labels = breach.get('Domain', '').lower().split('.')
+                # Stop before the bare TLD; nobody scans "com"
+                for i in range(len(labels) - 1):
+                    index.setdefault('.'.join(labels[i:]), []).append(breach)
+
+        self._cache_set(key, index, self.HIBP_CACHE_TTL)
+        return index
+
+    async def _bounded_as_completed(
+        self,
+        coros: List[Awaitable[Dict[str, Any]]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield results in completion order, running at most `scan_options.threads` at once."""
+        # A limit below 1 would leave every source waiting on the semaphore forever
+        semaphore = asyncio.Semaphore(max(1, int(self.config.scan_options.get('threads', 5))))
+
+        async def guarded(coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await coro
+
+        tasks = [asyncio.ensure_future(guarded(coro)) for coro in coros]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            # The caller stopped early or a source failed; don't leave the rest running
+            for task in tasks:
+                task.cancel()
+
     async def _monitor_paste_sites(self, target: ScanTarget) -> Dict[str, Any]:
         """Monitor paste sites for leaked data."""
         paste_data = {
@@ -120,21 +190,22 @@ class DarkWebModule(BaseModule):
 
         try:
             # Check public paste sites through legitimate APIs
-            async with aiohttp.ClientSession() as session:
-                # Monitor legitimate paste search engines
-                searches = [
-                    self._search_pastebin(session, target),
-                    self._search_ghostbin(session, target),
-                    self._search_archive_sites(session, target)
-                ]
-                
-                results = await asyncio.gather(*searches)
-                
-                for result in results:
-                    if result.get('recent'):
-                        paste_data['recent_pastes'].extend(result['recent'])
-                    if result.get('historical'):
-                        paste_data['historical_pastes'].extend(result['historical'])
+            session = self.http
+
+            # Monitor legitimate paste search engines
+            searches = [
+                self._search_pastebin(session, target),
+                self._search_ghostbin(session, target),
+                self._search_archive_sites(session, target)
+            ]
+            
+            results = await asyncio.gather(*searches)
+            
+            for result in results:
+                if result.get('recent'):
+                    paste_data['recent_pastes'].extend(result['recent'])
+                if result.get('historical'):
+                    paste_data['historical_pastes'].extend(result['historical'])
 
         except Exception as e:
             self.logger.error(f"Error monitoring paste sites: {str(e)}")
@@ -152,25 +223,29 @@ class DarkWebModule(BaseModule):
 
         try:
             # Scan legitimate security forums and research communities
-            async with aiohttp.ClientSession() as session:
-                forums = [
-                    'https://www.reddit.com/r/netsec',
-                    'https://www.reddit.com/r/InfoSecNews',
-                    'https://community.riskiq.com'
-                ]
-
-                for forum in forums:
-                    try:
-                        async with session.get(
-                            f"{forum}/search.json?q={target.domain}"
-                        ) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                forum_data['mentions'].extend(
-                                    self._process_forum_data(data, forum)
-                                )
-                    except Exception as e:
-                        self.logger.error(f"Error scanning forum {forum}: {str(e)}")
+            session = self.http
+            query = quote_plus(target.domain)
+
+            async def fetch(forum: str, url_template: str) -> List[Dict[str, Any]]:
+                async with session.get(
+                    url_template.format(q=query),
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        return self._process_forum_data(data, forum)
+                    return []
+
+            # Query all forums concurrently
+            results = await asyncio.gather(
+                *(fetch(forum, url_template) for forum, url_template in self.SECURITY_FORUMS),
+                return_exceptions=True
+            )
+            for (forum, _), result in zip(self.SECURITY_FORUMS, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error scanning forum {forum}: {str(result)}")
+                    continue
+                forum_data['mentions'].extend(result)
 
         except Exception as e:
             self.logger.error(f"Error scanning security forums: {str(e)}")
@@ -183,7 +258,7 @@ class DarkWebModule(BaseModule):
         market_data = {
             'mentions': [],
             'listings': [],
-            'last_checked': datetime.now().isoformat()
+            'last_checked': target.timestamp
         }
 
         try:
@@ -194,13 +269,12 @@ class DarkWebModule(BaseModule):
                 self._check_digital_shadows_marketplace(target)
             ]
 
-            results = await asyncio.gather(*platforms)
-            
-            for result in results:
-                if result.get('mentions'):
-                    market_data['mentions'].extend(result['mentions'])
-                if result.get('listings'):
-                    market_data['listings'].extend(result['listings'])
+            async with contextlib.aclosing(self._bounded_as_completed(platforms)) as results:
+                async for result in results:
+                    if result.get('mentions'):
+                        market_data['mentions'].extend(result['mentions'])
+                    if result.get('listings'):
+                        market_data['listings'].extend(result['listings'])
 
         except Exception as e:
             self.logger.error(f"Error monitoring markets: {str(e)}")
@@ -241,11 +315,8 @@ class DarkWebModule(BaseModule):
             all_events.extend(self._events_from_pastes(paste_data))
             all_events.extend(self._events_from_forums(forum_data))
             
-            analysis['timeline'] = sorted(
-                all_events,
-                key=lambda x: x['date'],
-                reverse=True
-            )
+            all_events.sort(key=itemgetter('date'), reverse=True)
+            analysis['timeline'] = all_events
 
             # Generate recommendations based on findings
             analysis['recommendations'] = self._generate_recommendations(
@@ -260,7 +331,7 @@ class DarkWebModule(BaseModule):
                 'total_breaches': len(breach_data.get('known_breaches', [])),
                 'total_pastes': len(paste_data.get('recent_pastes', [])),
                 'total_mentions': len(forum_data.get('mentions', [])),
-                'exposure_trend': self._calculate_exposure_trend(analysis['timeline'])
+                'exposure_trend': self._calculate_exposure_trend(all_events)
             }
 
         except Exception as e:
@@ -269,25 +340,21 @@ class DarkWebModule(BaseModule):
 
         return analysis
 
-    def _calculate_exposure_trend(self, timeline: List[Dict[str, Any]]) -> str:
+    def _calculate_exposure_trend(self, events: List[Dict[str, Any]]) -> str:
         """Calculate the trend of exposures over time."""
-        if not timeline:
+        if not events:
             return "insufficient_data"
 
         try:
-            # Group events by month
-            months = {}
-            for event in timeline:
-                month = event['date'][:7]  # YYYY-MM format
-                months[month] = months.get(month, 0) + 1
-
-            # Calculate trend
-            sorted_months = sorted(months.items())
-            if len(sorted_months) < 2:
+            # Group events by month (YYYY-MM); event order does not matter
+            months = Counter(event['date'][:7] for event in events)
+
+            # Calculate trend: the three latest months against everything before them
+            if len(months) < 2:
                 return "insufficient_data"
 
-            recent_events = sum(count for _, count in sorted_months[-3:])
-            older_events = sum(count for _, count in sorted_months[:-3])
+            recent_events = sum(count for _, count in heapq.nlargest(3, months.items()))
+            older_events = len(events) - recent_events
 
             if recent_events > older_events * 1.5:
                 return "increasing"
@@ -1,13 +1,28 @@
+import aiodns
 import asyncio
+import concurrent.futures
+import contextlib
+import dns.asyncresolver
 import dns.resolver
+import ijson
+import re
 import whois
 import ssl
-import socket
 import OpenSSL
 from datetime import datetime
-from typing import Dict, Any, List
-import aiohttp
-from ..framework import BaseModule, ScanTarget, ScanResult
+from operator import methodcaller
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+from ..framework import BaseModule, ConfigManager, ScanTarget, ScanResult
+
+# crt.sh packs several names into one name_value, separated by newlines or commas
+_CRT_NAME_SEPARATORS = re.compile(r'[\n,]')
+
+# Renders an rdata record directly, skipping the str() -> __str__ indirection
+_rdata_to_text = methodcaller('to_text')
+
+# Blocking WHOIS lookups get their own threads so they never queue behind the default executor
+_WHOIS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='whois')
 
 class PassiveReconModule(BaseModule):
     """
@@ -19,6 +34,19 @@ class PassiveReconModule(BaseModule):
     - Subdomain discovery through passive means
     """
 
+    # Seconds a cached lookup stays valid; registry and CT data change slowly
+    WHOIS_CACHE_TTL = 24 * 3600
+    CT_CACHE_TTL = 24 * 3600
+    DNS_CACHE_TTL = 300
+
+    # Parallel A lookups used to check which discovered subdomains still resolve
+    LIVENESS_CONCURRENCY = 50
+
+    def __init__(self, config: ConfigManager):
+        super().__init__(config)
+        # One native async resolver shared by every DNS query this module makes
+        self._dns_resolver = dns.asyncresolver.Resolver()
+
     @property
     def module_name(self) -> str:
         return "passive_recon"
@@ -39,12 +67,14 @@ class PassiveReconModule(BaseModule):
             dns_records = await dns_task
             ssl_info = await ssl_task
             subdomains = await subdomain_task
+            live_subdomains = await self._resolve_live_subdomains(subdomains)
 
             data = {
                 'whois_information': whois_info,
                 'dns_records': dns_records,
                 'ssl_certificate': ssl_info,
-                'discovered_subdomains': subdomains
+                'discovered_subdomains': subdomains,
+                'live_subdomains': live_subdomains
             }
 
             return ScanResult(target=target, module_name=self.module_name, data=data)
@@ -61,10 +91,16 @@ class PassiveReconModule(BaseModule):
 
     async def _get_whois_info(self, domain: str) -> Dict[str, Any]:
         """Retrieve WHOIS information for the domain."""
+        key = ('whois', domain.lower())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            # Use asyncio.to_thread for CPU-bound WHOIS lookup
-            w = await asyncio.to_thread(whois.whois, domain)
-            return {
+            # python-whois blocks on its socket, so run it on the dedicated WHOIS pool
+            loop = asyncio.get_running_loop()
+            w = await loop.run_in_executor(_WHOIS_EXECUTOR, whois.whois, domain)
+            info = {
                 'registrar': w.registrar,
                 'creation_date': str(w.creation_date),
                 'expiration_date': str(w.expiration_date),
@@ -73,33 +109,62 @@ class PassiveReconModule(BaseModule):
                 'emails': w.emails,
                 'org': w.org
             }
+            self._cache_set(key, info, self.WHOIS_CACHE_TTL)
+            return info
         except Exception as e:
             self.logger.error(f"WHOIS lookup failed: {str(e)}")
             return {'error': str(e)}
 
     async def _get_dns_records(self, domain: str) -> Dict[str, List[str]]:
         """Gather DNS records for the domain."""
+        key = ('dns', domain.lower())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         records = {}
         record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA', 'CNAME']
+
+        # Issue every query at once; total latency is that of the slowest one
+        tasks = {
+            record_type: asyncio.create_task(self._dns_resolver.resolve(domain, record_type))
+            for record_type in record_types
+        }
         
-        for record_type in record_types:
+        # Only authoritative "no such records" answers are worth caching as empty
+        complete = True
+        for record_type, task in tasks.items():
             try:
-                resolver = dns.resolver.Resolver()
-                answers = await asyncio.to_thread(resolver.resolve, domain, record_type)
-                records[record_type] = [str(answer) for answer in answers]
-            except Exception as e:
+                answers = await task
+                records[record_type] = list(map(_rdata_to_text, answers))
+            except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN) as e:
                 self.logger.debug(f"No {record_type} records found: {str(e)}")
                 records[record_type] = []
+            except Exception as e:
+                self.logger.debug(f"{record_type} lookup failed: {str(e)}")
+                records[record_type] = []
+                complete = False
         
+        if complete:
+            self._cache_set(key, records, self.DNS_CACHE_TTL)
         return records
 
     async def _get_ssl_info(self, domain: str) -> Dict[str, Any]:
         """Analyze SSL/TLS certificate information."""
         try:
+            # Handshake on the event loop so WHOIS/DNS/CT lookups keep running meanwhile
             context = ssl.create_default_context()
-            with socket.create_connection((domain, 443)) as sock:
-                with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                    cert = ssock.getpeercert()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(domain, 443, ssl=context, server_hostname=domain),
+                timeout=10
+            )
+            try:
+                cert = writer.get_extra_info('ssl_object').getpeercert()
+            finally:
+                writer.close()
+                # A peer that drops the connection during TLS shutdown is not our problem
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
                     
             return {
                 'subject': dict(x[0] for x in cert['subject']),
@@ -116,23 +181,62 @@ class PassiveReconModule(BaseModule):
 
     async def _discover_subdomains(self, domain: str) -> List[str]:
         """Discover subdomains through passive means."""
+        key = ('crtsh', domain.lower())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         subdomains = set()
+        add_subdomain = subdomains.add
         
         # Check Certificate Transparency logs
-        async with aiohttp.ClientSession() as session:
-            try:
-                url = f"https://crt.sh/?q=%.{domain}&output=json"
-                async with session.get(url) as response:
+        session = self.http
+        try:
+            url = f"https://crt.sh/?q=%.{domain}&output=json"
+            # Stream the CT log instead of holding the whole (often huge) body in memory
+            async with self._host_semaphores[urlsplit(url).hostname]:
+                async with self._stream_with_retry(session, url) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        for entry in data:
-                            name = entry['name_value'].lower()
+                        # Hoisted out of the loop; crt.sh can return tens of thousands of entries
+                        domain = domain.lower()
+                        suffix = '.' + domain
+                        async for name in ijson.items_async(response.content, 'item.name_value'):
+                            name = name.lower().replace('*.', '').replace('*', '')
                             # Split by newlines and commas (crt.sh sometimes returns multiple domains)
-                            for subdomain in name.replace('*', '').split('\n'):
-                                for sub in subdomain.split(','):
-                                    if sub.strip().endswith(domain):
-                                        subdomains.add(sub.strip())
-            except Exception as e:
-                self.logger.error(f"Subdomain discovery failed: {str(e)}")
+                            for sub in _CRT_NAME_SEPARATORS.split(name):
+                                sub = sub.strip()
+                                if sub == domain or sub.endswith(suffix):
+                                    add_subdomain(sub)
+                        # Only a successful CT response is worth remembering
+                        self._cache_set(key, sorted(subdomains), self.CT_CACHE_TTL)
+                    else:
+                        self.logger.debug(f"crt.sh returned status {response.status}")
+        except Exception as e:
+            self.logger.error(f"Subdomain discovery failed: {str(e)}")
         
-        return sorted(list(subdomains))
+        return sorted(subdomains)
+
+    async def _resolve_live_subdomains(self, subdomains: List[str]) -> Optional[List[str]]:
+        """
+        Return the subdomains that still have an A record; CT logs list many dead ones.
+
+        Returns None when liveness could not be determined, e.g. the resolver itself failed.
+        """
+        semaphore = asyncio.Semaphore(self.LIVENESS_CONCURRENCY)
+
+        async def resolves(subdomain: str) -> Optional[bool]:
+            async with semaphore:
+                try:
+                    await self.resolver.query_dns(subdomain, 'A')
+                    return True
+                except aiodns.error.DNSError:
+                    return False
+                except Exception as e:
+                    self.logger.debug(f"Liveness check for {subdomain} failed: {str(e)}")
+                    return None
+
+        alive = await asyncio.gather(*(resolves(subdomain) for subdomain in subdomains))
+        if None in alive:
+            self.logger.warning("Subdomain liveness unknown: resolver errors during lookups")
+            return None
+        return [subdomain for subdomain, is_alive in zip(subdomains, alive) if is_alive]
@@ -1,10 +1,16 @@
 import asyncio
 import aiohttp
 import re
+import soupsieve as sv
 from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 from ..framework import BaseModule, ScanTarget, ScanResult
+from ..utils.helpers import DataUtils
+
+def _class_strainer(css_class: str) -> SoupStrainer:
+    """Strainer matching elements that carry `css_class` among possibly several classes."""
+    return SoupStrainer(class_=re.compile(rf'(?:^|\s){re.escape(css_class)}(?:\s|$)'))
 
 class SocialMediaModule(BaseModule):
     """
@@ -16,6 +22,62 @@ class SocialMediaModule(BaseModule):
     - Basic social media content analysis
     """
 
+    # Profile search pages, filled in with the target's domain or bare company name
+    PLATFORM_URL_TEMPLATES = {
+        'twitter': "https://twitter.com/search?q={domain}",
+        'linkedin': "https://www.linkedin.com/company/{company}",
+        'github': "https://github.com/search?q={domain}&type=users"
+    }
+
+    # CSS selectors compiled once; soupsieve would otherwise look each string up per call
+    PLATFORM_SELECTORS = {
+        'twitter': {
+            'profile': sv.compile('div[data-testid="UserCell"]'),
+            'name': sv.compile('div[data-testid="UserName"]'),
+            'bio': sv.compile('div[data-testid="UserDescription"]')
+        },
+        'linkedin': {
+            'profile': sv.compile('.org-top-card'),
+            'name': sv.compile('.org-top-card-summary__title'),
+            'description': sv.compile('.org-top-card-summary__info')
+        },
+        'github': {
+            'profile': sv.compile('.user-list-item'),
+            'name': sv.compile('.user-list-info'),
+            'bio': sv.compile('.user-list-bio')
+        }
+    }
+
+    PROFILE_LINK_SELECTOR = sv.compile('a[href]')
+    TWITTER_VERIFIED_SELECTOR = sv.compile('svg[aria-label="Verified Account"]')
+
+    # Substring every profile href must contain; checked before any regex runs
+    PROFILE_HREF_NEEDLES = {
+        'twitter': '/',
+        'linkedin': '/company/',
+        'github': '/'
+    }
+
+    # Profile link patterns, compiled once rather than per element; LinkedIn's needle is enough
+    PROFILE_URL_PATTERNS = {
+        'twitter': re.compile(r'/\w+$'),
+        'github': re.compile(r'/\w+$')
+    }
+
+    # Prepended to a matched href to make it absolute; LinkedIn links already are
+    PROFILE_URL_PREFIXES = {
+        'twitter': 'https://twitter.com',
+        'linkedin': '',
+        'github': 'https://github.com'
+    }
+
+    # Restrict parsing to the profile fragments; everything else on the page is skipped
+    PROFILE_STRAINERS = {
+        'twitter': SoupStrainer('div', attrs={'data-testid': 'UserCell'}),
+        'linkedin': _class_strainer('org-top-card'),
+        'github': _class_strainer('user-list-item')
+    }
+
     @property
     def module_name(self) -> str:
         return "social_media"
@@ -59,63 +121,63 @@ class SocialMediaModule(BaseModule):
     async def _find_profiles(self, target: ScanTarget) -> Dict[str, Any]:
         """Find social media profiles associated with the domain."""
         profiles = {}
-        platforms = {
-            'twitter': {
-                'url': f"https://twitter.com/search?q={target.domain}",
-                'selectors': {
-                    'profile': 'div[data-testid="UserCell"]',
-                    'name': 'div[data-testid="UserName"]',
-                    'bio': 'div[data-testid="UserDescription"]'
-                }
-            },
-            'linkedin': {
-                'url': f"https://www.linkedin.com/company/{target.domain.split('.')[0]}",
-                'selectors': {
-                    'profile': '.org-top-card',
-                    'name': '.org-top-card-summary__title',
-                    'description': '.org-top-card-summary__info'
-                }
-            },
-            'github': {
-                'url': f"https://github.com/search?q={target.domain}&type=users",
-                'selectors': {
-                    'profile': '.user-list-item',
-                    'name': '.user-list-info',
-                    'bio': '.user-list-bio'
-                }
-            }
+        company = target.domain.split('.')[0]
+        urls = {
+            platform: template.format(domain=target.domain, company=company)
+            for platform, template in self.PLATFORM_URL_TEMPLATES.items()
         }
 
-        async with aiohttp.ClientSession() as session:
-            for platform, config in platforms.items():
-                try:
-                    headers = await self._get_platform_headers(platform)
-                    async with session.get(config['url'], headers=headers) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            profiles[platform] = await self._extract_profile_info(
-                                platform, content, config['selectors']
-                            )
-                except Exception as e:
-                    self.logger.error(f"Error finding profiles for {platform}: {str(e)}")
-                    profiles[platform] = {'error': str(e)}
+        # Query every platform concurrently
+        session = self.http
+        results = await asyncio.gather(
+            *(self._fetch_platform(session, platform, url) for platform, url in urls.items()),
+            return_exceptions=True
+        )
+
+        for platform, result in zip(urls, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error finding profiles for {platform}: {str(result)}")
+                profiles[platform] = {'error': str(result)}
+            elif result is not None:
+                profiles[platform] = result
 
         return profiles
 
+    async def _fetch_platform(
+        self,
+        session: aiohttp.ClientSession,
+        platform: str,
+        url: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one platform's profile search; None if the page is unavailable."""
+        headers = await self._get_platform_headers(platform)
+        status, content = await self._get(session, url, headers=headers)
+        if status != 200:
+            return None
+
+        return await self._extract_profile_info(platform, content, self.PLATFORM_SELECTORS[platform])
+
     async def _analyze_mentions(self, target: ScanTarget) -> Dict[str, List[Dict[str, Any]]]:
         """Analyze mentions of the target across social media platforms."""
         mentions = {}
-        search_terms = [target.domain] + [domain.split('.')[-2] for domain in target.subdomains or []]
+        # Subdomains of one site share a label; dict.fromkeys drops repeats but keeps order
+        labels = (DataUtils.split_domain(domain).domain for domain in target.subdomains or [])
+        search_terms = list(dict.fromkeys([target.domain] + [label for label in labels if label]))
         
-        async with aiohttp.ClientSession() as session:
-            for platform in ['twitter', 'reddit', 'hackernews']:
-                try:
-                    mentions[platform] = await self._search_platform_mentions(
-                        session, platform, search_terms
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error analyzing mentions for {platform}: {str(e)}")
-                    mentions[platform] = {'error': str(e)}
+        session = self.http
+        platforms = ['twitter', 'reddit', 'hackernews']
+        results = await asyncio.gather(
+            *(self._search_platform_mentions(session, platform, search_terms)
+              for platform in platforms),
+            return_exceptions=True
+        )
+
+        for platform, result in zip(platforms, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error analyzing mentions for {platform}: {str(result)}")
+                mentions[platform] = {'error': str(result)}
+            else:
+                mentions[platform] = result
 
         return mentions
 
@@ -130,24 +192,31 @@ class SocialMediaModule(BaseModule):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                for platform in ['twitter', 'linkedin', 'github']:
-                    platform_meta = await self._get_platform_metadata(
-                        session, platform, target
-                    )
-                    metadata['statistics'][platform] = platform_meta.get('statistics', {})
-                    metadata['engagement_metrics'][platform] = platform_meta.get('engagement', {})
-                    metadata['posting_frequency'][platform] = platform_meta.get('frequency', {})
-                    
-                    if 'hashtags' in platform_meta:
-                        metadata['common_hashtags'].update(platform_meta['hashtags'])
-                    if 'linked_profiles' in platform_meta:
-                        metadata['linked_profiles'].update(platform_meta['linked_profiles'])
+            session = self.http
+            platforms = ['twitter', 'linkedin', 'github']
+            platform_metas = await asyncio.gather(
+                *(self._get_platform_metadata(session, platform, target)
+                  for platform in platforms)
+            )
+
+            for platform, platform_meta in zip(platforms, platform_metas):
+                metadata['statistics'][platform] = platform_meta.get('statistics', {})
+                metadata['engagement_metrics'][platform] = platform_meta.get('engagement', {})
+                metadata['posting_frequency'][platform] = platform_meta.get('frequency', {})
+
+                if 'hashtags' in platform_meta:
+                    metadata['common_hashtags'].update(platform_meta['hashtags'])
+                if 'linked_profiles' in platform_meta:
+                    metadata['linked_profiles'].update(platform_meta['linked_profiles'])
 
         except Exception as e:
             self.logger.error(f"Error gathering metadata: {str(e)}")
             metadata['error'] = str(e)
 
+        # Sets were only needed for de-duplication; lists serialize without a fallback hook
+        metadata['common_hashtags'] = sorted(metadata['common_hashtags'])
+        metadata['linked_profiles'] = sorted(metadata['linked_profiles'])
+
         return metadata
 
     async def _find_employees(self, target: ScanTarget) -> List[Dict[str, Any]]:
@@ -155,17 +224,18 @@ class SocialMediaModule(BaseModule):
         employees = []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Search LinkedIn for employees
-                linkedin_employees = await self._search_linkedin_employees(session, target)
-                employees.extend(linkedin_employees)
+            session = self.http
+
+            # Search LinkedIn for employees
+            linkedin_employees = await self._search_linkedin_employees(session, target)
+            employees.extend(linkedin_employees)
 
-                # Search GitHub for contributors
-                github_employees = await self._search_github_contributors(session, target)
-                employees.extend(github_employees)
+            # Search GitHub for contributors
+            github_employees = await self._search_github_contributors(session, target)
+            employees.extend(github_employees)
 
-                # Deduplicate and enrich employee data
-                employees = await self._enrich_employee_data(employees)
+            # Deduplicate and enrich employee data
+            employees = await self._enrich_employee_data(employees)
 
         except Exception as e:
             self.logger.error(f"Error finding employees: {str(e)}")
@@ -215,16 +285,18 @@ class SocialMediaModule(BaseModule):
         self,
         platform: str,
         content: str,
-        selectors: Dict[str, str]
+        selectors: Dict[str, sv.SoupSieve]
     ) -> Dict[str, Any]:
         """Extract profile information from platform-specific content."""
         info = {}
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(
+            content, 'lxml', parse_only=self.PROFILE_STRAINERS.get(platform)
+        )
         
         try:
-            profile_elements = soup.select(selectors['profile'])
+            profile_elements = selectors['profile'].select(soup)
             for element in profile_elements:
-                name = element.select_one(selectors['name'])
+                name = selectors['name'].select_one(element)
                 if name:
                     profile_data = {
                         'name': name.text.strip(),
@@ -240,18 +312,17 @@ class SocialMediaModule(BaseModule):
 
     def _extract_profile_url(self, element: BeautifulSoup, platform: str) -> Optional[str]:
         """Extract profile URL from an element based on the platform."""
-        try:
-            if platform == 'twitter':
-                link = element.find('a', href=re.compile(r'/\w+$'))
-                return f"https://twitter.com{link['href']}" if link else None
-            elif platform == 'linkedin':
-                link = element.find('a', href=re.compile(r'/company/'))
-                return link['href'] if link else None
-            elif platform == 'github':
-                link = element.find('a', href=re.compile(r'/\w+$'))
-                return f"https://github.com{link['href']}" if link else None
-        except Exception:
+        needle = self.PROFILE_HREF_NEEDLES.get(platform)
+        if needle is None:
             return None
+        pattern = self.PROFILE_URL_PATTERNS.get(platform)
+
+        # Match hrefs directly instead of going through bs4's per-attribute matcher
+        for link in self.PROFILE_LINK_SELECTOR.select(element):
+            href = link['href']
+            if needle in href and (pattern is None or pattern.search(href)):
+                return self.PROFILE_URL_PREFIXES[platform] + href
+        return None
 
     def _extract_additional_metadata(
         self,
@@ -263,7 +334,7 @@ class SocialMediaModule(BaseModule):
         try:
             if platform == 'twitter':
                 metadata['followers'] = self._extract_twitter_followers(element)
-                metadata['verified'] = bool(element.select_one('svg[aria-label="Verified Account"]'))
+                metadata['verified'] = bool(self.TWITTER_VERIFIED_SELECTOR.select_one(element))
             elif platform == 'linkedin':
                 metadata['employees'] = self._extract_linkedin_employees(element)
                 metadata['industry'] = self._extract_linkedin_industry(element)
@@ -1,46 +1,233 @@
 import asyncio
+import contextlib
 import re
 import socket
 import ssl
 import ipaddress
+import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Set, Tuple
-from datetime import datetime
-from urllib.parse import urlparse
+from datetime import datetime, timezone
+from functools import lru_cache
+import aiodns
 import aiohttp
+import numpy as np
+import orjson
 from bs4 import BeautifulSoup
-import dns.resolver
 import tldextract
+from ..framework import create_dns_resolver, create_http_session
+
+# Patterns compiled once at import; the helpers below run them on every page and text blob
+
+_SCRIPT_PATTERNS = (
+    ('jQuery', re.compile(r'jquery.*\.js')),
+    ('React', re.compile(r'react.*\.js')),
+    ('Vue.js', re.compile(r'vue.*\.js')),
+    ('Angular', re.compile(r'angular.*\.js')),
+    ('Bootstrap', re.compile(r'bootstrap.*\.js'))
+)
+# Any library name at all; most script URLs fail this one search and skip the per-library patterns
+_SCRIPT_HINT_RE = re.compile(r'jquery|react|vue|angular|bootstrap')
+# In priority order; the lowest matching group index across all generator tags wins
+_CMS_NAMES = ('WordPress', 'Drupal', 'Joomla')
+_CMS_GENERATOR_RE = re.compile(r'(WordPress)|(Drupal)|(Joomla)')
+# One alternation, one group per service; a match's lastindex says which service it was
+_ANALYTICS_SERVICES = ('Google Analytics', 'Mixpanel', 'Hotjar')
+_ANALYTICS_RE = re.compile(r'(google-analytics\.com|ga\.js)|(mixpanel\.com)|(hotjar\.com)')
+# Handles stop at a query string or fragment, so 'acme?ref=footer' yields 'acme'
+_SOCIAL_PATTERNS = (
+    ('twitter', re.compile(r'twitter\.com/([^/\s"\'?#]+)')),
+    ('facebook', re.compile(r'facebook\.com/([^/\s"\'?#]+)')),
+    ('linkedin', re.compile(r'linkedin\.com/(?:company|in)/([^/\s"\'?#]+)')),
+    ('instagram', re.compile(r'instagram\.com/([^/\s"\'?#]+)'))
+)
+# Most anchors are site-internal; only hrefs naming a platform reach the per-platform patterns
+_SOCIAL_HINT_RE = re.compile(r'(?:twitter|facebook|linkedin|instagram)\.com/')
+# Fenced and length-capped so long word or digit runs cannot drive heavy backtracking
+_EMAIL_RE = re.compile(r'\b[\w.+-]{1,64}@[\w-]{1,63}(?:\.[\w-]{1,63}){1,4}\b')
+_PHONE_RE = re.compile(r'(?<!\w)\+?\d[\d\s-]{8,18}\d\b')
+
+# Maps each ASCII byte of a password to its character class (U/L/D/S) in one translate() pass
+_PASSWORD_SYMBOLS = b'!@#$%^&*(),.?":{}|<>'
+_PASSWORD_CLASS_TABLE = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789' + _PASSWORD_SYMBOLS,
+    b'U' * 26 + b'L' * 26 + b'D' * 10 + b'S' * len(_PASSWORD_SYMBOLS)
+)
+# \d also matches non-ASCII digits, which the ASCII table above cannot see
+_DIGIT_RE = re.compile(r'\d')
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{2,}')
+# Plain literals; str.__contains__ finds them without starting the regex engine
+_COMMON_SEQUENCES = ('123', 'abc', 'qwerty')
+
+_IPV4_RE = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+_IPV6_RE = re.compile(r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b')
+# The netloc group ends where urlparse's would (first '/', '?' or '#'), so no parse is needed
+_URL_RE = re.compile(r'https?://(?P<netloc>(?:[-\w.]|(?:%[\da-fA-F]{2}))+[^\s/?#]*)[^\s]*')
+# MD5, SHA-1 and SHA-256 are whole hex runs of 32, 40 or 64 digits: find each maximal run
+# once, then classify it by length; other lengths are simply not in the table
+_HEX_RUN_RE = re.compile(r'(?<!\w)[a-fA-F0-9]{32,64}(?!\w)')
+_HASH_TYPES = {32: 'md5', 40: 'sha1', 64: 'sha256'}
+
+# One extractor per process, on the bundled public suffix snapshot: no network fetch, no disk cache
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+# Building a context loads the CA bundle from disk, so do it once
+_SSL_CONTEXT = ssl.create_default_context()
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def _parse_cert_time(value: str) -> datetime:
+    """Parse an OpenSSL certificate time such as 'Jun  1 12:00:00 2025 GMT' without strptime."""
+    month, day, clock, year = value.split()[:4]
+    hour, minute, second = clock.split(':')
+    return datetime(
+        int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second),
+        tzinfo=timezone.utc
+    )
+
+def _has_valid_labels(domain: str) -> bool:
+    """Label-by-label hostname syntax check; linear time, no regex backtracking."""
+    if not domain.isascii():
+        return False
+    *labels, tld = domain.split('.')
+    if not labels or len(tld) < 2 or not tld.isalpha():
+        return False
+    for label in labels:
+        if (not label or len(label) > 63 or label[0] == '-' or label[-1] == '-'
+                or not label.replace('-', '').isalnum()):
+            return False
+    return True
+
+@lru_cache(maxsize=4096)
+def _split_normalized_domain(domain: str) -> tldextract.tldextract.ExtractResult:
+    return _TLD_EXTRACT(domain)
+
+def _flatten_rdn(rdns: Tuple) -> Dict[str, Any]:
+    """Flatten getpeercert()'s RDN sequence; attributes that occur more than once become lists."""
+    values: Dict[str, List[str]] = {}
+    for rdn in rdns:
+        for key, value in rdn:
+            values.setdefault(key, []).append(value)
+    return {key: found[0] if len(found) == 1 else found for key, found in values.items()}
+
+def _copy_rdn(rdn: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: list(value) if isinstance(value, list) else value for key, value in rdn.items()}
+
+# Parsed certificate fields by (domain, serial number); re-scans of a host skip the parsing
+_CERT_CACHE_SIZE = 1024
+_CERT_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, Any], datetime]] = {}
+
+def _parse_cert(domain: str, cert: Dict[str, Any]) -> Tuple[Dict[str, Any], datetime]:
+    key = (domain, cert['serialNumber'])
+    cached = _CERT_CACHE.get(key)
+    if cached is None:
+        fields = {
+            'issuer': _flatten_rdn(cert['issuer']),
+            'subject': _flatten_rdn(cert['subject']),
+            'expires': cert['notAfter'],
+            'version': cert['version'],
+            'serial_number': cert['serialNumber']
+        }
+        cached = (fields, _parse_cert_time(cert['notAfter']))
+        if len(_CERT_CACHE) >= _CERT_CACHE_SIZE:
+            # Drop the oldest entry; dicts keep insertion order
+            del _CERT_CACHE[next(iter(_CERT_CACHE))]
+        _CERT_CACHE[key] = cached
+    fields, expiry = cached
+    # Callers own (and may modify) what they get back, so never hand out the cached dicts
+    return {
+        **fields,
+        'issuer': _copy_rdn(fields['issuer']),
+        'subject': _copy_rdn(fields['subject'])
+    }, expiry
+
+# Seconds a domain's resolvability is remembered by is_valid_domain, and how many domains at most
+_RESOLVE_CACHE_TTL = 300
+_RESOLVE_CACHE_SIZE = 4096
+_RESOLVE_CACHE: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+# c-ares resolvers and HTTP sessions are bound to an event loop and hold a reference to it, so
+# a mapping keyed by loop would never release anything; only the most recent loop's is kept
+_RESOLVER: Optional[Tuple[asyncio.AbstractEventLoop, aiodns.DNSResolver]] = None
+_SESSION: Optional[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = None
+
+def _get_resolver() -> aiodns.DNSResolver:
+    global _RESOLVER
+    loop = asyncio.get_running_loop()
+    if _RESOLVER is None or _RESOLVER[0] is not loop:
+        _RESOLVER = (loop, create_dns_resolver())
+    return _RESOLVER[1]
+
+def _get_session() -> aiohttp.ClientSession:
+    global _SESSION
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION[0] is not loop or _SESSION[1].closed:
+        _SESSION = (loop, create_http_session())
+    return _SESSION[1]
+
+async def _resolves(domain: str) -> bool:
+    """Whether `domain` has an address record, answered from a short-lived cache when possible."""
+    key = DataUtils.normalize_domain(domain)
+    now = time.monotonic()
+    # Every entry has the same TTL and is (re)appended on store, so expired ones sit at the front
+    while _RESOLVE_CACHE and now - next(iter(_RESOLVE_CACHE.values()))[0] >= _RESOLVE_CACHE_TTL:
+        _RESOLVE_CACHE.popitem(last=False)
+    cached = _RESOLVE_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+
+    try:
+        await _get_resolver().getaddrinfo(key)
+        resolves = True
+    except aiodns.error.DNSError:
+        resolves = False
+    _RESOLVE_CACHE[key] = (time.monotonic(), resolves)
+    _RESOLVE_CACHE.move_to_end(key)
+    if len(_RESOLVE_CACHE) > _RESOLVE_CACHE_SIZE:
+        _RESOLVE_CACHE.popitem(last=False)
+    return resolves
 
 class NetworkUtils:
     """Utility functions for network operations and validation."""
     
     @staticmethod
-    async def is_valid_domain(domain: str) -> bool:
+    def is_well_formed_domain(domain: str) -> bool:
         """
-        Verify if a domain is valid and properly formatted.
+        Check that a domain is syntactically valid and under a known public suffix, without any I/O.
         
         Args:
             domain: The domain name to validate
             
         Returns:
-            bool: True if domain is valid, False otherwise
+            bool: True if domain is well formed, False otherwise
         """
         if not domain or len(domain) > 255:
             return False
             
-        pattern = r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
-        if not re.match(pattern, domain):
+        if not _has_valid_labels(domain):
             return False
             
+        # Extract domain parts
+        ext = DataUtils.split_domain(domain)
+        return bool(ext.domain and ext.suffix)
+
+    @staticmethod
+    async def is_valid_domain(domain: str) -> bool:
+        """
+        Verify if a domain is valid and properly formatted.
+        
+        Args:
+            domain: The domain name to validate
+            
+        Returns:
+            bool: True if domain is valid, False otherwise
+        """
         try:
-            # Extract domain parts
-            ext = tldextract.extract(domain)
-            if not all([ext.domain, ext.suffix]):
-                return False
-                
-            # Verify domain resolves
-            await asyncio.get_event_loop().getaddrinfo(domain, None)
-            return True
+            # Verify domain resolves (c-ares, no thread-pool hop) only once the cheap checks pass
+            return NetworkUtils.is_well_formed_domain(domain) and await _resolves(domain)
         except Exception:
             return False
 
@@ -64,15 +251,31 @@ class NetworkUtils:
             info['is_private'] = ip_obj.is_private
             
             if ip_obj.is_global:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f'https://ipapi.co/{ip}/json/') as response:
-                        if response.status == 200:
-                            info['details'] = await response.json()
+                session = _get_session()
+                async with session.get(
+                    f'https://ipapi.co/{ip}/json/',
+                    timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    if response.status == 200:
+                        info['details'] = orjson.loads(await response.read())
             
             return info
         except Exception as e:
             return {'ip': ip, 'error': str(e)}
 
+    @staticmethod
+    async def close_session():
+        """Close the HTTP session and DNS resolver shared by these helpers on the running loop."""
+        global _RESOLVER, _SESSION
+        loop = asyncio.get_running_loop()
+        if _SESSION is not None and _SESSION[0] is loop:
+            session, _SESSION = _SESSION[1], None
+            if not session.closed:
+                await session.close()
+        if _RESOLVER is not None and _RESOLVER[0] is loop:
+            resolver, _RESOLVER = _RESOLVER[1], None
+            await resolver.close()
+
 class WebUtils:
     """Utilities for web-based operations and analysis."""
     
@@ -82,7 +285,7 @@ class WebUtils:
         Detect technologies used by a website based on HTML content and headers.
         
         Args:
-            soup: BeautifulSoup object of the page
+            soup: BeautifulSoup object of the page; parse it with 'lxml' for faster tree walks
             headers: HTTP response headers
             
         Returns:
@@ -97,44 +300,31 @@ class WebUtils:
         }
         
         # Detect JavaScript libraries
-        script_patterns = {
-            'jQuery': r'jquery.*\.js',
-            'React': r'react.*\.js',
-            'Vue.js': r'vue.*\.js',
-            'Angular': r'angular.*\.js',
-            'Bootstrap': r'bootstrap.*\.js'
-        }
-        
         scripts = soup.find_all('script', src=True)
         for script in scripts:
             src = script['src'].lower()
-            for library, pattern in script_patterns.items():
-                if re.search(pattern, src):
+            if not _SCRIPT_HINT_RE.search(src):
+                continue
+            # A bundle can match several libraries (react-bootstrap.js), so check each
+            for library, pattern in _SCRIPT_PATTERNS:
+                if pattern.search(src):
                     technologies['javascript_libraries'].append(library)
         
-        # Detect CMS
-        cms_patterns = {
-            'WordPress': {'meta': {'name': 'generator', 'content': re.compile(r'WordPress')}},
-            'Drupal': {'meta': {'name': 'generator', 'content': re.compile(r'Drupal')}},
-            'Joomla': {'meta': {'name': 'generator', 'content': re.compile(r'Joomla')}}
+        # Detect CMS from the generator meta tags, read once
+        found = {
+            match.lastindex
+            for meta in soup.find_all('meta', {'name': 'generator'})
+            for match in _CMS_GENERATOR_RE.finditer(meta.get('content', ''))
         }
-        
-        for cms, patterns in cms_patterns.items():
-            if soup.find('meta', patterns['meta']):
-                technologies['cms'] = cms
-                break
+        if found:
+            technologies['cms'] = _CMS_NAMES[min(found) - 1]
         
         # Detect analytics
-        analytics_patterns = {
-            'Google Analytics': r'google-analytics\.com|ga\.js',
-            'Mixpanel': r'mixpanel\.com',
-            'Hotjar': r'hotjar\.com'
-        }
-        
         scripts_text = ' '.join(str(script) for script in scripts)
-        for analytics, pattern in analytics_patterns.items():
-            if re.search(pattern, scripts_text):
-                technologies['analytics'].append(analytics)
+        found = {match.lastindex for match in _ANALYTICS_RE.finditer(scripts_text)}
+        technologies['analytics'] = [
+            service for index, service in enumerate(_ANALYTICS_SERVICES, 1) if index in found
+        ]
         
         return technologies
 
@@ -144,7 +334,7 @@ class WebUtils:
         Extract metadata from HTML content.
         
         Args:
-            soup: BeautifulSoup object of the page
+            soup: BeautifulSoup object of the page; parse it with 'lxml' for faster tree walks
             
         Returns:
             Dict containing extracted metadata
@@ -163,42 +353,33 @@ class WebUtils:
         title_tag = soup.find('title')
         metadata['title'] = title_tag.text.strip() if title_tag else None
         
-        meta_tags = {
-            'description': ('name', 'description'),
-            'keywords': ('name', 'keywords'),
-            'author': ('name', 'author')
-        }
+        # One walk over the <meta> tags; the first tag with a given name wins
+        metas = {}
+        for meta in soup.find_all('meta', attrs={'name': True}):
+            metas.setdefault(meta['name'], meta)
         
-        for key, (attr, name) in meta_tags.items():
-            meta = soup.find('meta', {attr: name})
+        for key in ('description', 'keywords', 'author'):
+            meta = metas.get(key)
             if meta and meta.get('content'):
                 metadata[key] = meta['content']
                 if key == 'keywords':
                     metadata[key] = [k.strip() for k in meta['content'].split(',')]
         
-        # Extract social media links
-        social_patterns = {
-            'twitter': r'twitter\.com/([^/\s"\']+)',
-            'facebook': r'facebook\.com/([^/\s"\']+)',
-            'linkedin': r'linkedin\.com/(?:company|in)/([^/\s"\']+)',
-            'instagram': r'instagram\.com/([^/\s"\']+)'
-        }
-        
-        for platform, pattern in social_patterns.items():
-            links = soup.find_all('a', href=re.compile(pattern))
-            if links:
-                metadata['social_media'][platform] = [
-                    re.search(pattern, link['href']).group(1) for link in links
-                ]
-        
-        # Extract emails and phone numbers
-        text = soup.get_text()
-        metadata['emails'] = set(
-            re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        )
-        metadata['phone_numbers'] = set(
-            re.findall(r'\+?[\d\s-]{10,}', text)
-        )
+        # Extract social media links from a single walk over the anchors
+        hrefs = [
+            link['href'] for link in soup.find_all('a', href=True)
+            if _SOCIAL_HINT_RE.search(link['href'])
+        ]
+        for platform, pattern in _SOCIAL_PATTERNS:
+            handles = [match.group(1) for match in map(pattern.search, hrefs) if match]
+            if handles:
+                metadata['social_media'][platform] = handles
+        
+        # Extract emails and phone numbers node by node, never building the page's full text
+        for text in soup.stripped_strings:
+            if '@' in text:
+                metadata['emails'].update(_EMAIL_RE.findall(text))
+            metadata['phone_numbers'].update(_PHONE_RE.findall(text))
         
         return metadata
 
@@ -228,27 +409,27 @@ class SecurityUtils:
         }
         
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((domain, 443)) as sock:
-                with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                    cert = ssock.getpeercert()
-                    
-                    cert_info.update({
-                        'valid': True,
-                        'issuer': dict(x[0] for x in cert['issuer']),
-                        'subject': dict(x[0] for x in cert['subject']),
-                        'expires': cert['notAfter'],
-                        'version': cert['version'],
-                        'serial_number': cert['serialNumber']
-                    })
-                    
-                    # Check certificate issues
-                    expiry = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
-                    if expiry < datetime.now():
-                        cert_info['issues'].append('Certificate expired')
-                    
-                    if 'subjectAltName' in cert:
-                        cert_info['extensions']['san'] = cert['subjectAltName']
+            # Handshake on the event loop so concurrent analyses overlap
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(domain, 443, ssl=_SSL_CONTEXT, server_hostname=domain),
+                timeout=10
+            )
+            try:
+                cert = writer.get_extra_info('ssl_object').getpeercert()
+            finally:
+                writer.close()
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
+            
+            fields, expiry = _parse_cert(domain, cert)
+            cert_info.update(fields, valid=True)
+            
+            # Check certificate issues; expiry is judged afresh even for a cached certificate
+            if expiry < datetime.now(timezone.utc):
+                cert_info['issues'].append('Certificate expired')
+            
+            if 'subjectAltName' in cert:
+                cert_info['extensions']['san'] = cert['subjectAltName']
         
         except ssl.SSLError as e:
             cert_info['issues'].append(f'SSL Error: {str(e)}')
@@ -270,13 +451,16 @@ class SecurityUtils:
         Returns:
             Dict containing password analysis and recommendations
         """
+        classes = set(password.encode('ascii', 'ignore').translate(_PASSWORD_CLASS_TABLE))
         analysis = {
             'length': len(password),
             'score': 0,
-            'has_uppercase': bool(re.search(r'[A-Z]', password)),
-            'has_lowercase': bool(re.search(r'[a-z]', password)),
-            'has_numbers': bool(re.search(r'\d', password)),
-            'has_symbols': bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password)),
+            'has_uppercase': ord('U') in classes,
+            'has_lowercase': ord('L') in classes,
+            'has_numbers': ord('D') in classes or (
+                not password.isascii() and bool(_DIGIT_RE.search(password))
+            ),
+            'has_symbols': ord('S') in classes,
             'recommendations': []
         }
         
@@ -298,11 +482,12 @@ class SecurityUtils:
                 )
         
         # Check for common patterns
-        if re.search(r'(.)\1{2,}', password):  # Repeated characters
+        if _REPEATED_CHAR_RE.search(password):  # Repeated characters
             analysis['score'] -= 10
             analysis['recommendations'].append('Avoid repeated characters')
         
-        if re.search(r'(123|abc|qwerty)', password.lower()):  # Common sequences
+        lowered = password.lower()
+        if any(sequence in lowered for sequence in _COMMON_SEQUENCES):  # Common sequences
             analysis['score'] -= 15
             analysis['recommendations'].append('Avoid common sequences')
         
@@ -315,6 +500,7 @@ class DataUtils:
     """Data processing and analysis utilities."""
     
     @staticmethod
+    @lru_cache(maxsize=8192)
     def normalize_domain(domain: str) -> str:
         """
         Normalize a domain name for consistent comparison.
@@ -327,6 +513,20 @@ class DataUtils:
         """
         return domain.lower().strip().rstrip('.')
 
+    @staticmethod
+    def split_domain(domain: str) -> tldextract.tldextract.ExtractResult:
+        """
+        Split a domain into subdomain, registered label and public suffix.
+        
+        Args:
+            domain: Domain name to split
+            
+        Returns:
+            tldextract ExtractResult for the normalized domain
+        """
+        # Spellings of one host ('WWW.Example.com.', 'www.example.com') share a cache entry
+        return _split_normalized_domain(DataUtils.normalize_domain(domain))
+
     @staticmethod
     def extract_iocs(text: str) -> Dict[str, Set[str]]:
         """
@@ -349,31 +549,29 @@ class DataUtils:
             'sha256': set()
         }
         
+        # Each pattern needs a literal character; skip the regex pass when it is absent
         # IP addresses
-        iocs['ipv4'].update(
-            re.findall(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', text)
-        )
-        iocs['ipv6'].update(
-            re.findall(r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b', text)
-        )
-        
-        # Domains and URLs
-        urls = re.findall(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+[^\s]*', text)
-        for url in urls:
-            iocs['urls'].add(url)
-            parsed = urlparse(url)
-            if parsed.netloc:
-                iocs['domains'].add(parsed.netloc)
+        # Matches stream straight into the sets; no intermediate findall lists of duplicates
+        if '.' in text:
+            iocs['ipv4'] = {match.group() for match in _IPV4_RE.finditer(text)}
+        if ':' in text:
+            iocs['ipv6'] = {match.group() for match in _IPV6_RE.finditer(text)}
+        
+        # Domains and URLs from the same match
+        if '://' in text:
+            for match in _URL_RE.finditer(text):
+                iocs['urls'].add(match.group())
+                iocs['domains'].add(match.group('netloc'))
         
         # Emails
-        iocs['emails'].update(
-            re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        )
+        if '@' in text:
+            iocs['emails'] = {match.group() for match in _EMAIL_RE.finditer(text)}
         
-        # Hashes
-        iocs['md5'].update(re.findall(r'\b[a-fA-F0-9]{32}\b', text))
-        iocs['sha1'].update(re.findall(r'\b[a-fA-F0-9]{40}\b', text))
-        iocs['sha256'].update(re.findall(r'\b[a-fA-F0-9]{64}\b', text))
+        # Hashes, bucketed by digest length
+        for digest in _HEX_RUN_RE.findall(text):
+            hash_type = _HASH_TYPES.get(len(digest))
+            if hash_type:
+                iocs[hash_type].add(digest)
         
         return iocs
 
@@ -392,13 +590,10 @@ class DataUtils:
         if not data:
             return []
             
-        mean = sum(data) / len(data)
-        std = (sum((x - mean) ** 2 for x in data) / len(data)) ** 0.5
-        
-        anomalies = []
-        for i, value in enumerate(data):
-            z_score = (value - mean) / std if std > 0 else 0
-            if abs(z_score) > threshold:
-                anomalies.append((i, value))
-                
-        return anomalies
+        values = np.asarray(data, dtype=np.float64)
+        std = values.std()
+        if std == 0:
+            return []
+        
+        z_scores = np.abs(values - values.mean()) / std
+        return [(i, data[i]) for i in np.flatnonzero(z_scores > threshold).tolist()]
@@ -1,7 +1,11 @@
 import pytest
+import asyncio
 import os
 import yaml
-from src.osint.framework import ConfigManager, OSINTFramework
+from unittest.mock import AsyncMock, Mock, patch
+from src.osint.framework import (
+    BaseModule, ConfigManager, OSINTFramework, ScanResult, ScanTarget, resolve_ipv4
+)
 
 # Fixture for temporary configuration file
 @pytest.fixture
@@ -71,6 +75,8 @@ class TestConfigManager:
         
         assert config_manager.config['scan_options']['timeout'] == 30
         assert config_manager.config['scan_options']['threads'] == 5
+        assert config_manager.scan_options['threads'] == 5
+        assert config_manager.ports_range == '21-443'
 
 class TestOSINTFramework:
     def test_framework_initialization(self, test_config_file):
@@ -91,6 +97,111 @@ class TestOSINTFramework:
         
         assert len(framework.modules) == enabled_modules
 
+    @pytest.mark.asyncio
+    async def test_resolver_shared_and_closed(self, test_config_file):
+        """Test that the framework creates one resolver and closes it in aclose()."""
+        framework = OSINTFramework(str(test_config_file))
+
+        with patch('src.osint.framework.create_dns_resolver') as factory:
+            factory.return_value.close = AsyncMock()
+            assert framework.resolver is framework.resolver
+            await framework.aclose()
+
+        assert factory.call_count == 1
+        factory.return_value.close.assert_awaited_once()
+
+class _StubModule(BaseModule):
+    @property
+    def module_name(self) -> str:
+        return 'stub'
+
+    async def run(self, target: ScanTarget) -> ScanResult:
+        return ScanResult(target=target, module_name=self.module_name, data={})
+
+class TestBaseModule:
+    @pytest.mark.asyncio
+    async def test_duplicate_requests_coalesced(self):
+        """Test that identical concurrent requests are sent once, and survive a cancelled caller."""
+        module = _StubModule(Mock())
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 200, 'ok'
+
+        callers = [
+            asyncio.ensure_future(module._single_flight('https://example.com', fetch))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        callers[1].cancel()
+        results = await asyncio.gather(callers[0], callers[2])
+        assert results == [(200, 'ok')] * 2
+        assert callers[1].cancelled()
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_keeps_request(self):
+        """Test that cancelling the caller that started a request does not cancel it for the others."""
+        module = _StubModule(Mock())
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 200, 'ok'
+
+        callers = [
+            asyncio.ensure_future(module._single_flight('https://example.com', fetch))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        callers[0].cancel()
+        results = await asyncio.gather(callers[1], callers[2])
+        assert results == [(200, 'ok')] * 2
+        assert callers[0].cancelled()
+        assert len(calls) == 1
+        assert not module._inflight
+
+    @pytest.mark.asyncio
+    async def test_retry_after_capped(self):
+        """Test that short rate limits are waited out and ones beyond the budget are given up on."""
+        module = _StubModule(Mock())
+
+        def response(status, retry_after=None):
+            response = Mock(status=status, headers={'Retry-After': retry_after} if retry_after else {})
+            response.text = AsyncMock(return_value='ok')
+            return response
+
+        session = Mock()
+        session.get = AsyncMock(side_effect=[response(429, '1'), response(200)])
+        with patch('asyncio.sleep', new=AsyncMock()) as sleep:
+            assert await module._get_with_retry(session, 'https://example.com') == (200, 'ok')
+        assert sleep.await_count == 1
+
+        session.get = AsyncMock(side_effect=[response(429, '3600'), response(200)])
+        with patch('asyncio.sleep', new=AsyncMock()) as sleep:
+            assert await module._get_with_retry(session, 'https://example.com') == (429, 'ok')
+        sleep.assert_not_awaited()
+
+        session.get = AsyncMock(side_effect=[response(429, '40'), response(429, '40'), response(200)])
+        with patch('asyncio.sleep', new=AsyncMock()) as sleep:
+            assert await module._get_with_retry(session, 'https://example.com') == (429, 'ok')
+        assert sleep.await_count == 1
+
+@pytest.mark.asyncio
+async def test_resolve_ipv4():
+    """Test that resolved addresses come back as unique strings in resolver order."""
+    resolver = Mock()
+    resolver.getaddrinfo = AsyncMock(return_value=Mock(nodes=[
+        Mock(addr=(b'93.184.216.34', 0)),
+        Mock(addr=('93.184.216.35', 0)),
+        Mock(addr=(b'93.184.216.34', 0))
+    ]))
+
+    assert await resolve_ipv4(resolver, 'example.com') == ['93.184.216.34', '93.184.216.35']
+
 def test_results_directory_creation(test_config_file):
     """Test that results directory is created."""
     framework = OSINTFramework(str(test_config_file))